@@ -1,4 +1,31 @@
-import pygame, time, random
+import pygame
+import collections
+import numpy as np
+
+# Optional numba JIT for the per-frame numeric step. If numba is not
+# installed the game falls back to the vectorized update + spatial-hash
+# collision path.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Integrate the block x-positions of one obstacle and AABB-test every
+# block against the player in a single pass. Compiled with numba when
+# available (module-level so the compiled function is shared).
+def _step_and_collide(block_xs, block_ys, velocity, dt, px, py, pw, ph, bw, bh):
+    hit = False
+    for i in range(block_xs.shape[0]):
+        block_xs[i] += velocity * dt
+        x = block_xs[i]
+        y = block_ys[i]
+        if x < px + pw and x + bw > px and y < py + ph and y + bh > py:
+            hit = True
+    return hit
+
+if NUMBA_AVAILABLE:
+    _step_and_collide = njit(cache=True)(_step_and_collide)
 
 class Entity:
     def __init__(self, 
@@ -19,22 +46,22 @@ class Entity:
         pass
 
 class Player(Entity):
-    def __init__(self, 
-                 x_spawn: float, 
-                 y_spawn: float, 
-                 velocity: float, 
-                 gravity_constant: float, 
-                 sprite: pygame.Surface) -> None:
-        
+    def __init__(self,
+                 x_spawn: float,
+                 y_spawn: float,
+                 velocity: float,
+                 gravity_constant: float,
+                 sprite: pygame.Surface,
+                 sounds: dict) -> None:
+
         super().__init__(x_spawn, y_spawn, velocity, sprite)
         self.gravity_constant = gravity_constant
         self.rect = self.sprite.get_rect()
 
-        # Sounds
-        self.jump_sound = pygame.mixer.Sound("sfx/bounce.wav")
-        self.jump_sound.set_volume(0.1)
-        self.death_sound = pygame.mixer.Sound("sfx/death.wav")
-        self.death_sound.set_volume(0.5)
+        # Sounds are loaded once by Game and shared, so resetting the scene
+        # (and rebuilding the Player) does not re-read the WAV files
+        self.jump_sound = sounds["jump"]
+        self.death_sound = sounds["death"]
 
     def update(self, dt: float) -> None:
         # Update player
@@ -59,34 +86,17 @@ class Player(Entity):
 
 # Represents a single Flappy Bird style obstacle. An obstacle is defined
 # as a collection of blocks with a gap for the player to fly through.
+#
+# The obstacle itself is pure metadata (block layout, pass/score state);
+# the per-block position state lives in flat Structure-of-Arrays numpy
+# arrays owned by Environment, where every block in the world is updated
+# with a single vectorized operation per frame.
 class Obstacle(Entity):
 
-    # Represents a single block of an obstacle
-    class ObstacleBlock(Entity):
-        def __init__(self, 
-                    x_spawn: float, 
-                    y_spawn: float, 
-                    velocity: float, 
-                    sprite: pygame.Surface) -> None:
-            
-            super().__init__(x_spawn, y_spawn, velocity, sprite)
-            self.rect = self.sprite.get_rect()
-
-        def update(self, dt) -> None:
-            self.x += self.velocity * dt
-            self.rect.x = int(self.x)
-            self.rect.y = int(self.y)
-
-        def render(self, screen: pygame.Surface) -> None:
-            screen.blit(self.sprite, (self.x, self.y))
-
-        def info(self) -> str:
-            return str(self.x)
-
-    def __init__(self, 
-                 x_spawn: float, 
-                 y_spawn: float, 
-                 velocity: float, 
+    def __init__(self,
+                 x_spawn: float,
+                 y_spawn: float,
+                 velocity: float,
                  screen_height: int,
                  gap_height: int, # Number of blocks missing to form gap
                  gap_loc: int, # Number of blocks from the top of the screen the gap is located at
@@ -97,45 +107,39 @@ class Obstacle(Entity):
         self.BLOCK_SIZE = 48 # The size of the sprite for a single block
 
         # Calculate number of blocks required to fill screen
-        self.num_blocks = round(self.screen_height/self.BLOCK_SIZE)
+        self.num_blocks = self.screen_height // self.BLOCK_SIZE
 
         # Calculate gap
         self.gap_range = (gap_loc, gap_loc + gap_height)
 
-        # Create blocks
-        self.blocks = self.create_blocks()
+        # Create block arrays
+        self.create_blocks()
 
         self.passed = False # Track if the player has passed this obstacle
 
     # -- Create blocks --
     # The reason we break down the obstacles into blocks is to allow for obstacles with
     # gaps at different locations, like those in the original Flappy Bird.
-    def create_blocks(self) -> list[ObstacleBlock]:
-        o = []
-        current_block = 0
-        for i in range(self.num_blocks):
-            if i < self.gap_range[0] or i > self.gap_range[1]:
-                o.append(Obstacle.ObstacleBlock(self.x, # Block y value
-                                                current_block, 
-                                                self.velocity, 
-                                                self.sprite))        
-            current_block += self.BLOCK_SIZE
-        return o
-
-    def update(self, dt) -> None:
-        self.x += self.velocity * dt
-        # Update obstacle
-        for b in self.blocks:
-            b.update(dt)
-
-    def render(self, screen: pygame.Surface) -> None:
-        for b in self.blocks:
-            b.render(screen)
+    def create_blocks(self) -> None:
+        # Rows of blocks that are not part of the gap
+        kept = [i for i in range(self.num_blocks)
+                if i < self.gap_range[0] or i > self.gap_range[1]]
+
+        # Block y offsets never change, so they are integers from the start
+        # and never need casting again
+        self.block_ys = np.array([i * self.BLOCK_SIZE for i in kept], dtype=np.int32)
+        self.n_blocks = len(kept)
+
+    # Render this obstacle's blocks into a single column surface so the
+    # whole obstacle can be drawn with one blit instead of one per block.
+    def build_column(self) -> pygame.Surface:
+        column = pygame.Surface((self.sprite.get_width(), self.screen_height),
+                                pygame.SRCALPHA)
+        for y in self.block_ys.tolist():
+            column.blit(self.sprite, (0, y))
+        return column
 
     def info(self) -> str:
-        result = []
-        for b in self.blocks:
-            result.append(b.info())
         return "Obstacle debug"
 
 # Manages the obstacles and collisions between obstacles and 
@@ -149,38 +153,103 @@ class Environment:
                  sprites: dict,
                  player: Player) -> None:
         
-        self.obstacles = [] # Contains all the obstacles currently active
+        self.obstacles = collections.deque() # Contains all the obstacles currently active
         self.obstacle_spawn_point = 1280 # Obstacles spawn just off screen to the right
         self.obstacle_velocity = obstacle_velocity
-        self.new_obstacle_timer = 0 
         self.obstacle_gap = obstacle_gap # Size of gap in obstacles
-        self.freq = freq # Obstacle frequency
+        # Spawn cadence in seconds, so it is framerate-independent
+        # (freq is given in frames assuming 60 FPS)
+        self.spawn_interval_s = freq / 60
+        self.spawn_accum = 0.0 # Time accumulated since the last spawn
         self.screen = screen
         self.sprites = sprites
         self.player = player
         self.score_tracker = 0 # Tracks how many times the player has passed an obstacle
 
+        # Uniform grid spatial hash of block positions, rebuilt each frame.
+        # Cell size covers both a block and the player so collision queries
+        # only need to look at the handful of cells the player touches.
+        self.CELL = max(self.sprites["obstacle"].get_width(), self.player.rect.width)
+        self.spatial_hash = {}
+
+        self.player_hit = False # Collision result from the JIT step
+
+        # Flat Structure-of-Arrays block state across every obstacle. Each
+        # obstacle owns a contiguous span of these arrays, ordered
+        # oldest-first to match the obstacle deque, so the whole world's
+        # block motion is one vectorized (or JIT) update per frame.
+        self.all_block_xs = np.empty(0, dtype=np.float32)
+        self.all_block_ys = np.empty(0, dtype=np.int32)
+
+        # Cache of pre-tiled column surfaces keyed by (gap_loc, gap_height).
+        # Only a handful of gap locations are ever generated, so columns are
+        # rendered once and shared between obstacles.
+        self.column_cache = {}
+
+        # Scrolling obstacle layer. Every block moves with the same constant
+        # velocity, so instead of re-blitting each column per frame the whole
+        # layer is scrolled left and freshly spawned columns are painted onto
+        # its right edge. Slightly wider than the screen so columns can spawn
+        # just off-screen.
+        block_w = self.sprites["obstacle"].get_width()
+        self.obstacle_layer = pygame.Surface(
+            (self.screen.get_width() + block_w, self.screen.get_height()),
+            pygame.SRCALPHA)
+        self.scroll_accum = 0.0 # Fractional scroll carried between frames
+
+        # Pre-rolled ring of gap locations, so the spawn branch reads an
+        # array slot instead of going through random.randint each time
+        self._gaps = np.random.randint(2, 11, size=4096, dtype=np.int32)
+        self._gap_i = 0
+
+    # Rebuild the grid cell -> block positions mapping from the flat
+    # block arrays.
+    def rebuild_spatial_hash(self) -> None:
+        self.spatial_hash.clear()
+        for x, y in zip(self.all_block_xs.tolist(), self.all_block_ys.tolist()):
+            cell = (int(x) // self.CELL, int(y) // self.CELL)
+            self.spatial_hash.setdefault(cell, []).append((x, y))
+
     def remove_obstacle(self) -> None:
-        self.obstacles.pop(0) # Remove the oldest obstacle from the list
+        # Remove the oldest obstacle and drop its span from the front of
+        # the flat block arrays
+        o = self.obstacles.popleft()
+        self.all_block_xs = self.all_block_xs[o.n_blocks:]
+        self.all_block_ys = self.all_block_ys[o.n_blocks:]
 
     def add_obstacle(self, obstacle: Obstacle) -> None:
         self.obstacles.append(obstacle)
+        self.all_block_xs = np.concatenate(
+            [self.all_block_xs,
+             np.full(obstacle.n_blocks, obstacle.x, dtype=np.float32)])
+        self.all_block_ys = np.concatenate(
+            [self.all_block_ys, obstacle.block_ys])
 
     def update_obstacles(self, dt) -> None:
+        # Sync per-obstacle metadata x from the flat array (every block of
+        # an obstacle shares its x position)
+        offset = 0
         for o in self.obstacles:
-            o.update(dt)
-            if o.x < -200: # Remove obstacle if it has reached the edge of the screen
-                self.remove_obstacle()
+            o.x = float(self.all_block_xs[offset])
+            offset += o.n_blocks
 
             # Check for player passing obstacle
             if o.x < self.player.x and not o.passed:
                 o.passed = True
                 self.score_tracker += 1
 
-        if self.new_obstacle_timer > self.freq: # Time to spawn a new obstacle
+        # Remove obstacles that have reached the edge of the screen in a
+        # separate pass: obstacles despawn oldest-first, so only the front
+        # of the deque needs checking
+        while self.obstacles and self.obstacles[0].x < -200:
+            self.remove_obstacle()
+
+        self.spawn_accum += dt
+        if self.spawn_accum >= self.spawn_interval_s: # Time to spawn a new obstacle
 
-            # Randomize gap location
-            gap = random.randint(2,10)
+            # Randomize gap location from the pre-rolled ring
+            gap = int(self._gaps[self._gap_i])
+            self._gap_i = (self._gap_i + 1) & 4095
 
             o = Obstacle(self.obstacle_spawn_point,
                 0,
@@ -189,17 +258,70 @@ class Environment:
                 self.obstacle_gap,
                 gap,
                 self.sprites["obstacle"])
-            self.add_obstacle(o)
-            self.new_obstacle_timer = 0
 
-        self.new_obstacle_timer += 1
+            # Paint the obstacle's pre-tiled column onto the right edge of
+            # the scrolling layer. Layer content sits at logical x minus
+            # the pending fractional scroll, so offset the paint position
+            # the same way to keep the column aligned with its hitbox.
+            key = (gap, self.obstacle_gap)
+            if key not in self.column_cache:
+                self.column_cache[key] = o.build_column()
+            self.obstacle_layer.blit(
+                self.column_cache[key],
+                (round(self.obstacle_spawn_point - self.scroll_accum), 0))
+
+            self.add_obstacle(o)
+            self.spawn_accum -= self.spawn_interval_s
+
+    # Scroll the obstacle layer by the integer part of this frame's
+    # movement, carrying the fractional remainder so the layer stays in
+    # sync with the logical block positions.
+    def scroll_layer(self, dt) -> None:
+        self.scroll_accum += self.obstacle_velocity * dt
+        dx = int(self.scroll_accum)
+        if dx:
+            self.obstacle_layer.scroll(dx, 0)
+            self.scroll_accum -= dx
+            # Clear the strip uncovered on the right edge
+            w = self.obstacle_layer.get_width()
+            h = self.obstacle_layer.get_height()
+            self.obstacle_layer.fill((0, 0, 0, 0), (w + dx, 0, -dx, h))
 
     def update(self, dt) -> None:
+        block = self.sprites["obstacle"]
+        px, py, pw, ph = self.player.rect
+
+        if NUMBA_AVAILABLE:
+            # One JIT-compiled integrate+collide pass over every block in
+            # the world
+            self.player_hit = bool(_step_and_collide(
+                self.all_block_xs, self.all_block_ys,
+                self.obstacle_velocity, dt,
+                px, py, pw, ph,
+                block.get_width(), block.get_height()))
+        else:
+            # Vectorized integration + spatial-hash collision query
+            self.all_block_xs += self.obstacle_velocity * dt
+            self.rebuild_spatial_hash()
+
+        # Scroll before spawning: a column painted this frame must not be
+        # shifted by this frame's movement, since its logical x is not
+        # integrated until next frame.
+        self.scroll_layer(dt)
         self.update_obstacles(dt)
 
     def render(self, screen: pygame.Surface) -> None:
-        for o in self.obstacles:
-            o.render(screen)
+        # The whole obstacle field is a single blit of the scrolled layer
+        screen.blit(self.obstacle_layer, (0, 0))
+
+    # Screen regions covered by the obstacles this frame
+    # (one column-height rect per obstacle). The layer can diverge from
+    # the logical x by up to a pixel of pending fractional scroll, and
+    # int(o.x) truncates up to another pixel, so inflate by 2 per side.
+    def dirty_rects(self) -> list[pygame.Rect]:
+        bw = self.sprites["obstacle"].get_width()
+        h = self.screen.get_height()
+        return [pygame.Rect(int(o.x) - 2, 0, bw + 4, h) for o in self.obstacles]
 
     def info(self) -> list[str]:
         obstacles_info = []
@@ -225,29 +347,37 @@ class DebugText:
 
     def update(self) -> None:
         self.text = self.create_debug_text()
+        self.rendered = self.font.render(self.text, True, "white")
 
     def render(self, screen: pygame.Surface) -> None:
-        self.rendered = self.font.render(self.text, True, "white")
-        screen.blit(self.rendered, (self.x, self.y)) 
+        screen.blit(self.rendered, (self.x, self.y))
 
 # Stores the score to render as text to the screen.
+# The rendered surface is cached and only re-rendered when the score
+# changes, since font rasterization is expensive.
 class Score:
     def __init__(self, x, y) -> None:
         self.font = pygame.font.SysFont("Calibri", 36)
         self.score = 0
         self.text = str(self.score)
+        self.rendered = self.font.render(self.text, True, "white")
+        self.dirty = False # Set when the score changes
         self.x = x
         self.y = y
 
     # Adds 1 to the score
     def add_score(self) -> None:
         self.score += 1
+        self.dirty = True
 
     def update(self) -> None:
-        self.text = str(self.score)
+        if self.dirty:
+            self.text = str(self.score)
+            self.rendered = self.font.render(self.text, True, "white")
+            self.dirty = False
 
     def render(self, screen: pygame.Surface) -> None:
-        screen.blit(self.font.render(self.text, True, "white"), (self.x, self.y))
+        screen.blit(self.rendered, (self.x, self.y))
 
 # Handles switching between scenes
 class SceneManager:
@@ -267,9 +397,10 @@ class SceneManager:
     
     # Resets main scene
     def reset_main(self) -> None:
-        new_scene = MainScene(self, 
-                              self.scenes["main"].screen,  
-                              self.scenes["main"].sprites, 
+        new_scene = MainScene(self,
+                              self.scenes["main"].screen,
+                              self.scenes["main"].sprites,
+                              self.scenes["main"].sounds,
                               self.scenes["main"].debug)
         self.scenes["main"] = new_scene
 
@@ -290,7 +421,7 @@ class Scene:
         self.sprites = sprites
         self.debug = debug
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         pass
 
     def render(self) -> None:
@@ -311,7 +442,7 @@ class StartScene(Scene):
         self.text_x = 400
         self.text_y = 200
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         pass
 
     def render(self) -> None:
@@ -324,7 +455,13 @@ class StartScene(Scene):
         pygame.display.update() 
 
     def poll_events(self) -> None:
-        for event in pygame.event.get():
+        # Only pull the event types this scene handles; the C-level filter
+        # avoids building Python Event objects for mouse motion etc.
+        # Unhandled event types are dropped afterwards so they cannot fill
+        # up the queue.
+        events = pygame.event.get([pygame.QUIT, pygame.KEYDOWN])
+        pygame.event.clear()
+        for event in events:
 
             if event.type == pygame.QUIT: # If the user closes the window
                 self.manager.quit_game()
@@ -337,12 +474,14 @@ class StartScene(Scene):
 # Main game scene
 class MainScene(Scene):
 
-    def __init__(self, 
-                 manager: SceneManager, 
-                 screen: pygame.Surface, 
-                 sprites: dict, 
+    def __init__(self,
+                 manager: SceneManager,
+                 screen: pygame.Surface,
+                 sprites: dict,
+                 sounds: dict,
                  debug: bool) -> None:
         super().__init__(manager, screen, sprites, debug)
+        self.sounds = sounds
 
         # GAME PARAMS #
         self.GRAVITY_CONSTANT = 1700
@@ -352,14 +491,13 @@ class MainScene(Scene):
         self.OBS_VEL = -200
         self.OBS_GAP = 2
 
-        self.previous_time = None
-
         # Set up player
-        self.player = Player(self.screen.get_width()/2, 
-                             self.screen.get_height()/2, 
-                             self.PLAYER_VEL, 
+        self.player = Player(self.screen.get_width()/2,
+                             self.screen.get_height()/2,
+                             self.PLAYER_VEL,
                              self.GRAVITY_CONSTANT,
-                             self.sprites["player"]) 
+                             self.sprites["player"],
+                             self.sounds)
         
         # Set up environment
         self.env = Environment(self.OBS_VEL, 
@@ -372,18 +510,13 @@ class MainScene(Scene):
         # Set up score
         self.score = Score(self.screen.get_width()/2, 50)
 
-        self.debug_text = DebugText(50, 50, self.player, self.env)
-
-    def update(self) -> None:
-
-        if self.previous_time is None: # First run through the loop needs a previous_time value to compute delta time
-            self.previous_time = time.time()
+        # Only built in debug mode: constructing DebugText rasterizes an
+        # initial string, which is wasted work on the normal path
+        self.debug_text = DebugText(50, 50, self.player, self.env) if debug else None
 
-        # Delta time
-        now = time.time()
-        dt = now - self.previous_time
-        self.previous_time = now 
+        self.prev_rects = None # Screen regions drawn last frame (dirty rects)
 
+    def update(self, dt: float) -> None:
         # Update player
         self.player.update(dt)
         # Update environment
@@ -402,31 +535,52 @@ class MainScene(Scene):
         self.score.update()
 
         # Update debug text
-        if self.debug:  
+        if self.debug_text is not None:
             self.debug_text.update()
 
     def render(self) -> None:
-        # Clear screen
-        self.screen.fill("black")
-
-        # Draw background
-        self.screen.blit(self.sprites["background"], (0, 0))
-
-        # Draw player
+        # The background is opaque and covers the whole screen, so there is
+        # no fill; instead of repainting all of it each frame we restore it
+        # only over the regions drawn last frame (dirty rects).
+        bg = self.sprites["background"]
+        screen_rect = self.screen.get_rect()
+
+        if self.prev_rects is None:
+            # First frame composites the full background
+            self.screen.blit(bg, (0, 0))
+            self.prev_rects = [screen_rect]
+        else:
+            for r in self.prev_rects:
+                self.screen.blit(bg, r, r)
+
+        # Draw this frame's sprites and collect the regions they cover
+        rects = [pygame.Rect(self.player.rect)]
         self.player.render(self.screen)
-        # Draw environment
+
         self.env.render(self.screen)
-        # Draw score
+        rects.extend(self.env.dirty_rects())
+
         self.score.render(self.screen)
+        rects.append(self.score.rendered.get_rect(topleft=(self.score.x, self.score.y)))
 
-        if self.debug:
+        if self.debug_text is not None:
             self.debug_text.render(self.screen)
+            rects.append(screen_rect) # Debug text can be arbitrarily wide
 
-        # Update the display
-        pygame.display.update() 
+        rects = [r.clip(screen_rect) for r in rects]
+
+        # Update only the regions restored or drawn this frame
+        pygame.display.update(self.prev_rects + rects)
+        self.prev_rects = rects
 
     def poll_events(self) -> None:
-        for event in pygame.event.get():
+        # Only pull the event types this scene handles; the C-level filter
+        # avoids building Python Event objects for mouse motion etc.
+        # Unhandled event types are dropped afterwards so they cannot fill
+        # up the queue.
+        events = pygame.event.get([pygame.QUIT, pygame.KEYDOWN])
+        pygame.event.clear()
+        for event in events:
 
             if event.type == pygame.QUIT: # If the user closes the window
                 self.manager.quit_game()
@@ -439,11 +593,28 @@ class MainScene(Scene):
 
     # Checks for a player collision with an obstacle.
     # Returns True if a collision is detected.
+    #
+    # With numba available the collision flag was already computed by the
+    # JIT step in Environment.update. Otherwise, query the spatial hash for
+    # the few grid cells around the player and AABB-test the candidates.
     def player_collision(self) -> bool:
-        for o in self.env.obstacles:
-            for b in o.blocks:
-                if b.rect.colliderect(self.player.rect):
-                    return True
+        if NUMBA_AVAILABLE:
+            return self.env.player_hit
+
+        block = self.sprites["obstacle"]
+        bw = block.get_width()
+        bh = block.get_height()
+
+        px, py, pw, ph = self.player.rect
+        cell = self.env.CELL
+
+        # Blocks are hashed by their top-left corner, so expand the query
+        # region by one block size to catch blocks straddling cells.
+        for cx in range((px - bw) // cell, (px + pw) // cell + 1):
+            for cy in range((py - bh) // cell, (py + ph) // cell + 1):
+                for x, y in self.env.spatial_hash.get((cx, cy), ()):
+                    if x < px + pw and x + bw > px and y < py + ph and y + bh > py:
+                        return True
         return False
 
 # Death screen
@@ -458,7 +629,7 @@ class DeathScene(Scene):
         self.text_x = 400
         self.text_y = 200
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         pass
 
     def render(self) -> None:
@@ -470,7 +641,13 @@ class DeathScene(Scene):
         pygame.display.update() 
 
     def poll_events(self) -> None:
-        for event in pygame.event.get():
+        # Only pull the event types this scene handles; the C-level filter
+        # avoids building Python Event objects for mouse motion etc.
+        # Unhandled event types are dropped afterwards so they cannot fill
+        # up the queue.
+        events = pygame.event.get([pygame.QUIT, pygame.KEYDOWN])
+        pygame.event.clear()
+        for event in events:
 
             if event.type == pygame.QUIT: # If the user closes the window
                 self.manager.quit_game()
@@ -491,13 +668,14 @@ class Game:
         self.screen = pygame.display.set_mode((1280, 720))
         self.running = True
         self.sprites = self.load_sprites()
+        self.sounds = self.load_sounds()
         self.debug = False # Default off
 
         # Scene system
         self.scene_manager = SceneManager()
         # Register scenes
-        scenes = {"start": StartScene(self.scene_manager, self.screen, self.sprites, self.debug), 
-                  "main": MainScene(self.scene_manager, self.screen, self.sprites, self.debug), 
+        scenes = {"start": StartScene(self.scene_manager, self.screen, self.sprites, self.debug),
+                  "main": MainScene(self.scene_manager, self.screen, self.sprites, self.sounds, self.debug),
                   "death": DeathScene(self.scene_manager, self.screen, self.sprites, self.debug)}
         self.scene_manager.initialize(scenes, "start")
 
@@ -506,13 +684,19 @@ class Game:
         # pygame.mixer.music.play()
         pygame.mixer.music.set_volume(0.1)
 
+        # Frame clock. Monotonic, caps the framerate, and provides delta
+        # time without per-frame time.time() syscalls.
+        self.clock = pygame.time.Clock()
+
     # MAIN GAME LOOP #
     def run(self) -> None:
-        self.previous_time = time.time()
         while self.running:
 
+            dt = self.clock.tick(60) / 1000.0 # Delta time in seconds, capped at 60 FPS
+            dt = min(dt, 0.1) # Bound the physics step to avoid tunneling after a stall
+
             self.scene_manager.current_scene.poll_events()
-            self.scene_manager.current_scene.update()
+            self.scene_manager.current_scene.update(dt)
             self.scene_manager.current_scene.render()
 
             if self.scene_manager.quit == True:
@@ -527,9 +711,24 @@ class Game:
 
         sprites["player"] = pygame.image.load("gfx/ball.png").convert_alpha()
         sprites["obstacle"] = pygame.image.load("gfx/block.png").convert_alpha()
-        sprites["background"] = pygame.image.load("gfx/bg.png").convert_alpha()
+        # The background is opaque, so convert() it to the display pixel
+        # format and let the full-screen blit take the fast opaque path
+        # instead of the per-pixel alpha blender.
+        sprites["background"] = pygame.image.load("gfx/bg.png").convert()
 
         return sprites
+
+    # Load sound effects once so scene resets reuse the decoded sounds
+    # instead of re-reading the WAV files from disk.
+    def load_sounds(self) -> dict:
+        sounds = {}
+
+        sounds["jump"] = pygame.mixer.Sound("sfx/bounce.wav")
+        sounds["jump"].set_volume(0.1)
+        sounds["death"] = pygame.mixer.Sound("sfx/death.wav")
+        sounds["death"].set_volume(0.5)
+
+        return sounds
     
     # Set debug mode on or off
     def set_debug(self, debug: bool) -> None:
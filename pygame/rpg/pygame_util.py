@@ -22,6 +22,7 @@ class SceneManager:
 
     def set_scene(self, new_scene: str) -> None:
         self.current_scene = self.scenes[new_scene]
+        self.current_scene.on_enter()
 
     def get_scene(self) -> None:
         return self.current_scene
@@ -42,7 +43,7 @@ class Scene:
         self.sprites = sprites
         self.debug = debug
 
-    def update(self) -> None:
+    def update(self, dt) -> None:
         pass
 
     def render(self) -> None:
@@ -51,3 +52,9 @@ class Scene:
     def poll_events(self) -> None:
         pass
 
+    # Called by the SceneManager whenever this scene becomes current,
+    # so scenes that do not repaint the full screen every frame can
+    # clear whatever the previous scene left behind.
+    def on_enter(self) -> None:
+        pass
+
@@ -1,30 +1,48 @@
-import pygame, time, random
+import pygame
+import numpy as np
 from pygame_util import Scene, SceneManager
 
+# Optional numba JIT for the per-frame collision scan. The scan also runs
+# fine as plain Python if numba is not installed.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Test the tiles under the player AABB against the boolean collision
+# grid. Compiled to native code with numba when available.
+def _scan_collisions(collision_mask, px, py, pw, ph, ts):
+    rows, cols = collision_mask.shape
+    tx0 = px // ts
+    tx1 = (px + pw - 1) // ts
+    ty0 = py // ts
+    ty1 = (py + ph - 1) // ts
+    for ty in range(ty0, ty1 + 1):
+        for tx in range(tx0, tx1 + 1):
+            if 0 <= ty < rows and 0 <= tx < cols and collision_mask[ty, tx]:
+                return True
+    return False
+
+if NUMBA_AVAILABLE:
+    _scan_collisions = njit(cache=True)(_scan_collisions)
+
+
+# Converted surfaces cached by filename, so re-entering a scene (or any
+# future scene reusing an image) skips the decode + convert entirely
+_SURFACE_CACHE = {}
+
+def load_surface(path: str) -> pygame.Surface:
+    surface = _SURFACE_CACHE.get(path)
+    if surface is None:
+        surface = pygame.image.load(path).convert_alpha()
+        _SURFACE_CACHE[path] = surface
+    return surface
 
 #################
 ## Tile system ##
 #################
 
-# A single tile
-class Tile:
-    def __init__(self, x, y, sprite: pygame.Surface, sprite_id: int) -> None:
-        self.sprite = sprite
-        self.x = x
-        self.y = y
-        self.sprite_id = sprite_id
-
-        # Collision rect
-        self.rect = self.sprite.get_rect()
-        self.rect.x = self.x
-        self.rect.y = self.y
-
-    def update(self) -> None:
-        pass
-
-    def render(self) -> None:
-        pass
-
 # A set of sprites for tiles loaded from a tilesheet file
 #
 # Tiles will be loaded and numbered from left to right 
@@ -34,9 +52,10 @@ class Tile:
 # of the tile.
 #
 class Tileset:
-    def __init__(self, filename: str, original_tilesize: int, scale_factor: int = 1, sprites=None) -> None:
+    def __init__(self, filename: str, original_tilesize: int, scale_factor: int = 1,
+                 sprites=None, used_ids=None) -> None:
         if sprites is None:
-            self.tilesheet = pygame.image.load(filename).convert_alpha() # Load tileset image from file
+            self.tilesheet = load_surface(filename) # Load tileset image from file (cached)
         else:
             self.tilesheet = sprites # Provide already loaded tilesheet
 
@@ -45,19 +64,23 @@ class Tileset:
         self.scale_factor = scale_factor
         self.scaled_size = self.tilesize * self.scale_factor # Final size of sprites in tileset after scaling
 
-        tile_id = 0
-        for y in range(int(self.tilesheet.get_height()/self.tilesize)):
-            for x in range(int(self.tilesheet.get_width()/self.tilesize)):
-                tile_rect = pygame.Rect(x*self.tilesize, y*self.tilesize, self.tilesize, self.tilesize)
-                tile_image = self.tilesheet.subsurface(tile_rect)
-
-                # Apply scale factor
-                tile_image = pygame.transform.scale(tile_image, 
-                                              (tile_image.get_width() * self.scale_factor, 
-                                               tile_image.get_height() * self.scale_factor))
-
-                self.tileset[tile_id] = tile_image
+        # Scale the whole sheet once, then cut no-copy subsurface views
+        # from it. One big scale replaces hundreds of tiny per-tile scale
+        # calls and keeps every tile's pixels in a single contiguous
+        # surface.
+        self.scaled_sheet = pygame.transform.scale(
+            self.tilesheet,
+            (self.tilesheet.get_width() * self.scale_factor,
+             self.tilesheet.get_height() * self.scale_factor)).convert_alpha()
 
+        ts = self.scaled_size
+        tile_id = 0
+        for y in range(self.scaled_sheet.get_height() // ts):
+            for x in range(self.scaled_sheet.get_width() // ts):
+                # Skip tiles the caller never references
+                if used_ids is None or tile_id in used_ids:
+                    self.tileset[tile_id] = self.scaled_sheet.subsurface(
+                        pygame.Rect(x*ts, y*ts, ts, ts))
                 tile_id += 1
 
     def get_tileset(self) -> dict:
@@ -71,36 +94,62 @@ class Tileset:
 # Takes in a list of lists populated by ID numbers corresponding to a particular
 # tileset. This represents the map to be populated with tiles.
 class Tilemap:
-    def __init__(self, map: list[list], tileset: Tileset) -> None:
+    def __init__(self, map: list[list], tileset: Tileset, background_color=None) -> None:
         self.tileset = tileset
         self.map_spec = map
-        self.map = [[]]
         self.tilesize = self.tileset.scaled_size # Size of each tile in the map
 
-        # Create map tiles from spec
-        x_coord = 0
-        y_coord = 0
-        for y in map:
-            row = []
-            for x in y:
-
-                sprite = self.tileset.get_tile_sprite(x)
+        # Tile data in Structure-of-Arrays layout: parallel position
+        # arrays plus a flat sprite list, instead of a grid of Tile
+        # objects. The only consumer is the bake below, which batches the
+        # whole layout through one blits() call.
+        cols = len(map[0])
+        rows = len(map)
+        xs, ys = np.meshgrid(np.arange(cols, dtype=np.int32) * self.tilesize,
+                             np.arange(rows, dtype=np.int32) * self.tilesize)
+        self.xs = xs.ravel()
+        self.ys = ys.ravel()
+        tiles = self.tileset.tileset # Direct dict index, no method call per cell
+        self.sprites = [tiles[x] for y in map for x in y]
+
+        # Tile ids as a numpy grid (row, col), for O(1) id lookups without
+        # touching any per-tile objects
+        self.ids = np.asarray(map, dtype=np.uint8)
+
+        # Pre-bake the entire map into a single surface. Tiles never
+        # change, so per-frame rendering becomes one blit of this surface
+        # at the camera offset instead of one blit per tile. With a
+        # background color the bake is fully opaque and the per-frame blit
+        # is a plain copy with no alpha blending.
+        size = (cols * self.tilesize, rows * self.tilesize)
+        if background_color is not None:
+            self.surface = pygame.Surface(size).convert()
+            self.surface.fill(background_color)
+        else:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        self.surface.blits(list(zip(self.sprites,
+                                    zip(self.xs.tolist(), self.ys.tolist()))),
+                           doreturn=0)
 
-                tile = Tile(x_coord, y_coord, sprite, x)
-                row.append(tile)
-                x_coord += self.tilesize
-            y_coord += self.tilesize
-            x_coord = 0
-            self.map.append(row)
+        # Reused per-frame by render so no Rect is allocated per blit
+        self.viewport = pygame.Rect(0, 0, 0, 0)
 
-    def update(self, dt) -> None:
-        pass
+    # Tile id under a world pixel coordinate: a single C-level array index
+    def get_tile_at(self, px: int, py: int) -> int:
+        return self.ids[py // self.tilesize, px // self.tilesize]
 
     def render(self, screen: pygame.Surface, camera_adj: tuple) -> None:
-        pass
-        # for y in self.map:
-        #     for x in y:
-        #         screen.blit(x.sprite, (x.x + camera_adj[0], x.y + camera_adj[1]))
+        # Blit only the visible viewport of the pre-baked map surface;
+        # everything off-screen is culled by the area rect. The viewport
+        # size is fixed, so only its position changes per frame.
+        viewport = self.viewport
+        if viewport.w == 0:
+            viewport.size = screen.get_size()
+        viewport.x = max(0, -camera_adj[0])
+        viewport.y = max(0, -camera_adj[1])
+        screen.blit(self.surface,
+                    (camera_adj[0] + viewport.x, camera_adj[1] + viewport.y),
+                    viewport)
 
 ###################
 ## Camera system ##
@@ -116,21 +165,26 @@ class Camera:
 
         self.subject = subject
 
-        self.camera_adjustment_x = 0
-        self.camera_adjustment_y = 0
+        # Screen center, computed once
+        self.half_w = self.screen_w // 2
+        self.half_h = self.screen_h // 2
 
         # Initial camera adjustment
-        # Place subject in center of camera
-        self.camera_adjustment_x = (self.screen_w/2) - self.subject.x
-        self.camera_adjustment_y = (self.screen_h/2) - self.subject.y
+        # Place subject in center of camera.
+        # Pre-rounded adjustment tuple, rebuilt only when the subject
+        # moves, so render code can reuse one object per camera position
+        self.adj_int = (self.half_w - int(self.subject.x),
+                        self.half_h - int(self.subject.y))
 
     def get_camera_adjustment(self) -> tuple:
-        return (self.camera_adjustment_x, self.camera_adjustment_y)
+        return self.adj_int
 
     def update(self, dt) -> None:
         # Update camera adjustment based on new subject position
-        self.camera_adjustment_x = (self.screen_w/2) - self.subject.x
-        self.camera_adjustment_y = (self.screen_h/2) - self.subject.y
+        new_adj = (self.half_w - int(self.subject.x),
+                   self.half_h - int(self.subject.y))
+        if new_adj != self.adj_int:
+            self.adj_int = new_adj
 
     
 
@@ -153,35 +207,52 @@ class Animation:
         # print("IN ANIMATION CONSTRUCTOR of " + self.name)
         # print(type(self.tileset))
 
-        self.current_sprite_id = 0
+        self.current_sprite_id = keyframes[0]
 
         self.keyframes = keyframes
 
         self.loop_animation = False
         self.animation_frequency = 0
-        self.current_keyframe = 0 
+        self.current_keyframe = 0
         self.keyframe_time = 0 # For delta time
 
+        # Cached Surface for the current keyframe, refreshed only when the
+        # keyframe advances, so render is a plain attribute read
+        self.current_sprite = self.tileset.get_tile_sprite(self.current_sprite_id)
+
+        # Animations whose keyframes are all the same sprite (the
+        # stationary/attack poses) never change frame, so update can
+        # return immediately
+        self.is_static = len(set(keyframes)) == 1
+
     def get_current_sprite(self) -> pygame.Surface:
-        # print(self.tileset)
-        return self.tileset.get_tile_sprite(self.current_sprite_id)
+        return self.current_sprite
 
     def update(self, dt) -> None:
 
+            if self.is_static: # Constant pose, nothing to advance
+                return
+
             self.keyframe_time += dt # Keeping track of how long the current animation frame has been displayed
 
             if self.keyframe_time >= self.animation_frequency: 
                 if len(self.keyframes) - 1 <= self.current_keyframe: # End of this run of animation
 
                     if self.loop_animation is True:
+                        # Rewind the sprite as well as the keyframe index;
+                        # previously only the index was reset, so looping
+                        # animations froze on their last frame
                         self.current_keyframe = 0
+                        self.current_sprite_id = self.keyframes[0]
+                        self.current_sprite = self.tileset.get_tile_sprite(self.current_sprite_id)
                     else:
                         self.deactivate_animation()
 
-                else: 
+                else:
                     self.current_keyframe += 1 # Move to next keyframe
                     self.current_sprite_id = self.keyframes[self.current_keyframe] # Assign sprite at new keyframe
-                    
+                    self.current_sprite = self.tileset.get_tile_sprite(self.current_sprite_id)
+
                 self.keyframe_time = 0 # Reset keyframe time before ending animation
 
     # Plays a single desired animation for this entity.
@@ -199,16 +270,30 @@ class Animation:
 #
 # A sprite can only have one active animation at a time
 class AnimationManager:
+    # Parsed Tilesets cached by source sheet and geometry, so entities
+    # spawned from the same spritesheet share one Tileset instead of
+    # re-cutting and re-scaling it per spawn. The sheets live in
+    # Game.sprites for the lifetime of the program, so keying on id() is
+    # safe here.
+    _tileset_cache = {}
+
     def __init__(self, spritesheets: dict, tilesize: int, scale: int) -> None:
-        
+
         self.tilesets = {}
 
         # Parse spritesheets into tilesets
         for s in spritesheets:
-            tileset = Tileset("none", tilesize, scale, spritesheets[s])
+            key = (id(spritesheets[s]), tilesize, scale)
+            tileset = AnimationManager._tileset_cache.get(key)
+            if tileset is None:
+                tileset = Tileset("none", tilesize, scale, spritesheets[s])
+                AnimationManager._tileset_cache[key] = tileset
             self.tilesets[s] = tileset
         
-        self.active_animation = Animation("dummy", self.tilesets[list(self.tilesets.keys())[0]], [0]) # Set to dummy as default
+        # Seed the dummy default from the first tileset without building a
+        # throwaway list of every key (this runs on every entity spawn)
+        first_tileset = next(iter(self.tilesets.values()))
+        self.active_animation = Animation("dummy", first_tileset, [0]) # Set to dummy as default
         # print(self.active_animation.name)
 
         # Animations are registered in a dictionary with a name as a key
@@ -224,12 +309,19 @@ class AnimationManager:
         # print(self.tilesets[tileset])
         self.animations[name] = Animation(name, self.tilesets[tileset], sprite_ids)
 
-    # Get current animation frame
+    # Shared zero-size placeholder returned when no animation is active,
+    # instead of allocating a fresh Surface per call
+    _EMPTY_SPRITE = None
+
+    # Get current animation frame. Reads the Animation's cached frame
+    # directly rather than going through another method call per entity
+    # per frame.
     def get_current_sprite(self) -> pygame.Surface:
         if self.active_animation is not None:
-            return self.active_animation.get_current_sprite() # type: ignore
-        else:
-            return pygame.Surface((0,0))
+            return self.active_animation.current_sprite # type: ignore
+        if AnimationManager._EMPTY_SPRITE is None:
+            AnimationManager._EMPTY_SPRITE = pygame.Surface((0,0)).convert()
+        return AnimationManager._EMPTY_SPRITE
 
     # Update animation frame
     def update(self, dt):
@@ -251,7 +343,22 @@ class AnimationManager:
 ## Entities ##
 ##############
 
+# Unit movement vectors per direction, shared by all moving entities so
+# movement is a table lookup instead of an if/elif chain per frame.
+_DIR_VEC = {"up": (0.0, -1.0),
+            "down": (0.0, 1.0),
+            "left": (-1.0, 0.0),
+            "right": (1.0, 0.0)}
+
+# Animation names precomposed per direction, so activating an animation
+# never concatenates strings at runtime
+_WALK_NAMES = {d: "walking_" + d for d in _DIR_VEC}
+_STATIONARY_NAMES = {d: "stationary_" + d for d in _DIR_VEC}
+_ATTACK_NAMES = {d: "attack_" + d for d in _DIR_VEC}
+
 class Player:
+    __slots__ = ("x", "y", "velocity", "direction", "moving", "animations", "rect")
+
     def __init__(self, spritesheets: dict, x, y) -> None:
         self.x = x
         self.y = y
@@ -285,17 +392,12 @@ class Player:
         self.rect = pygame.Rect(self.x, self.y, 16, 16)
 
     def move(self, dt) -> None:
-        if self.direction == "up":
-            self.y -= self.velocity * dt
-        elif self.direction == "down":
-            self.y += self.velocity * dt       
-        elif self.direction == "left":
-            self.x -= self.velocity * dt      
-        elif self.direction == "right":
-            self.x += self.velocity * dt
+        dx, dy = _DIR_VEC[self.direction]
+        self.x += dx * self.velocity * dt
+        self.y += dy * self.velocity * dt
 
     def attack(self) -> None:
-        self.animations.activate_animation("attack_" + self.direction, 0.1, False)
+        self.animations.activate_animation(_ATTACK_NAMES[self.direction], 0.1, False)
 
     def set_direction(self, new_direction: str) -> None:
         self.direction = new_direction
@@ -306,22 +408,17 @@ class Player:
 
     def stop_moving(self) -> None:
         self.moving = False
-        self.animations.activate_animation("stationary_" + self.direction, 0.1, True)
+        self.animations.activate_animation(_STATIONARY_NAMES[self.direction], 0.1, True)
 
     # Check if forward movement would result in a collision with the provided
     # Rect object in the current direction of movement.
     def check_movement_collision(self, dt, collision_rect: pygame.Rect) -> bool:
-        new_y = 0
-        new_x = 0
-        
-        if self.direction == "up":
-            new_y = self.y - self.velocity * dt
-        elif self.direction == "down":
-            new_y = self.y + self.velocity * dt       
-        elif self.direction == "left":
-            new_x = self.x - self.velocity * dt      
-        elif self.direction == "right":
-            new_x = self.x + self.velocity * dt
+        # Same vector-table dispatch as move(); the unmoved axis stays 0,
+        # matching the original branch behavior
+        dx, dy = _DIR_VEC[self.direction]
+        step = self.velocity * dt
+        new_x = self.x + dx * step if dx else 0
+        new_y = self.y + dy * step if dy else 0
 
         # copy current rect
         new_rect = pygame.Rect(self.rect.left, self.rect.top, self.rect.width, self.rect.height)
@@ -347,9 +444,14 @@ class Player:
         self.update_collider()
     
     def render(self, screen: pygame.Surface, camera_adj: tuple) -> None:
-        screen.blit(self.animations.get_current_sprite(), (self.x + camera_adj[0], self.y + camera_adj[1]))
+        # Integer destination: avoids SDL's float coercion and keeps the
+        # sprite on whole pixels
+        screen.blit(self.animations.get_current_sprite(),
+                    (int(self.x) + camera_adj[0], int(self.y) + camera_adj[1]))
 
 class Enemy:
+    __slots__ = ("spritesheet", "x", "y", "health", "animations")
+
     def __init__(self, spritesheets: dict, x, y) -> None:
         self.spritesheet = spritesheets
         self.x = x
@@ -370,30 +472,41 @@ class Enemy:
         screen.blit(self.animations.get_current_sprite(), (self.x + camera_adj[0], self.y + camera_adj[1]))
 
 class Projectile:
+    # One AnimationManager (and therefore one parsed/scaled Tileset) shared
+    # by every projectile. Building these per spawn meant rescanning and
+    # rescaling the whole projectile sheet on every single shot.
+    _shared_animations = None
+
+    velocity = 500 # Same for every projectile
+
+    __slots__ = ("spritesheets", "x", "y", "rotation", "direction", "animations")
+
     def __init__(self, spritesheets: dict, x, y) -> None:
         self.spritesheets = spritesheets
         self.x = x
         self.y = y
-        self.velocity = 500
         self.rotation = 0
         self.direction = "right"
 
-        self.animations = AnimationManager(spritesheets, 16, 2)
-        self.animations.register_animation("projectile", [0, 1, 2, 3, 4], "projectile")
-        self.animations.activate_animation("projectile", 0.1, True)
+        self.animations = Projectile.get_shared_animations(spritesheets)
+
+    # Lazily build the shared animation manager on first use
+    @classmethod
+    def get_shared_animations(cls, spritesheets: dict) -> AnimationManager:
+        if cls._shared_animations is None:
+            animations = AnimationManager(spritesheets, 16, 2)
+            animations.register_animation("projectile", [0, 1, 2, 3, 4], "projectile")
+            animations.activate_animation("projectile", 0.1, True)
+            cls._shared_animations = animations
+        return cls._shared_animations
 
     def move(self, dt) -> None:
-        if self.direction == "up":
-            self.y -= self.velocity * dt
-        elif self.direction == "down":
-            self.y += self.velocity * dt       
-        elif self.direction == "left":
-            self.x -= self.velocity * dt      
-        elif self.direction == "right":
-            self.x += self.velocity * dt
+        dx, dy = _DIR_VEC[self.direction]
+        self.x += dx * self.velocity * dt
+        self.y += dy * self.velocity * dt
 
     def set_direction(self, new_direction: str) -> None:
-        self.direction = new_direction    
+        self.direction = new_direction
 
     def update(self, dt):
         self.animations.update(dt)
@@ -402,16 +515,26 @@ class Projectile:
     def render(self, screen: pygame.Surface, camera_adj: tuple):
         screen.blit(self.animations.get_current_sprite(),  (self.x + camera_adj[0], self.y + camera_adj[1]))
 
-class Button:
+# Buttons are DirtySprites so static scenes can batch them through a
+# LayeredDirty group and only repaint the ones whose hover state changed.
+class Button(pygame.sprite.DirtySprite):
     def __init__(self, x, y, text: str) -> None:
+        super().__init__()
         self.x = x
         self.y = y
 
         self.font = pygame.font.SysFont("Calibri", 36)
-        self.color = "white"
         self.text = text
 
-        self.text_surface = self.font.render(self.text, True, self.color)
+        # Pre-render both hover color variants once; update just swaps
+        # references instead of rasterizing the text every frame.
+        # convert_alpha() matches the display format so blits stay on
+        # SDL's fast same-format path
+        self.surf_white = self.font.render(self.text, True, "white").convert_alpha()
+        self.surf_blue = self.font.render(self.text, True, "blue").convert_alpha()
+
+        self.text_surface = self.surf_white
+        self.image = self.text_surface # Sprite image drawn by the group
         self.rect = self.text_surface.get_rect()
         self.rect.x = self.x
         self.rect.y = self.y
@@ -421,13 +544,11 @@ class Button:
         self.event = lambda: print("Default button") # Function for when the button is pressed
 
     def update(self, dt):
-        if self.hovered is True:
-            self.color = "blue"
-        else:
-            self.color = "white"
-
-        # Rerender text
-        self.text_surface = self.font.render(self.text, True, self.color)    
+        new_surface = self.surf_blue if self.hovered else self.surf_white
+        if new_surface is not self.text_surface:
+            self.text_surface = new_surface
+            self.image = new_surface
+            self.dirty = 1 # Mark for repaint by the LayeredDirty group
 
     def set_hover(self, hovered: bool):
         self.hovered = hovered
@@ -442,30 +563,37 @@ class Button:
 ############
 ## Scenes ##
 ############
+
+# MAP
+# Built once at module load; restarting the game (which constructs a
+# fresh StartScene) reuses the same constant instead of re-allocating
+# the nested lists
+MAP     =      [[101,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,102],
+                [81,0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 79],
+                [81,0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
+                [81,0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,71, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
+                [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
+                [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
+                [81, 0, 0, 0, 0, 0, 0, 0, 0,71, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
+                [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
+                [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
+                [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,71, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
+                [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
+                [112,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,113]]
+
+# The same map as a numpy id grid, shared by every StartScene instance
+_MAP_ARR = np.array(MAP, dtype=np.uint8)
+
 class StartScene(Scene):
     def __init__(self, manager: SceneManager, screen: pygame.Surface, sprites: dict, debug: bool) -> None:
         super().__init__(manager, screen, sprites, debug)
         # self.entities = []
-        self.previous_time = None
-
-        # MAP
-        MAP     =      [[101,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,102], 
-                        [81,0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 79], 
-                        [81,0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79], 
-                        [81,0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,71, 0, 0, 0, 0, 0, 0, 0, 0, 0,79], 
-                        [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
-                        [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
-                        [81, 0, 0, 0, 0, 0, 0, 0, 0,71, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
-                        [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
-                        [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
-                        [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,71, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
-                        [81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,79],
-                        [112,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,113]]
-
-        # Create tileset
-        self.tileset = Tileset("gfx/rpg_sprites.png", 16, 4)
-        # Create tilemap
-        self.tilemap = Tilemap(MAP, self.tileset)
+
+        # Create tileset (only the tile ids the map references get scaled)
+        used_ids = set(np.unique(_MAP_ARR).tolist())
+        self.tileset = Tileset("gfx/rpg_sprites.png", 16, 4, used_ids=used_ids)
+        # Create tilemap, baked over the water color so its blit is opaque
+        self.tilemap = Tilemap(MAP, self.tileset, background_color=(30, 124, 184))
 
         # Create player
         # Player animations
@@ -477,17 +605,35 @@ class StartScene(Scene):
         enemy_anims = {"enemy_idle": self.sprites["enemy_idle"]}
         self.enemy = Enemy(enemy_anims, 500, 500)
 
-        # Projectiles
-        self.projectile = Projectile({"projectile": self.sprites["projectile"]}, 50, 50)
+        # Projectiles: no standing Projectile entity is kept, just the
+        # shared animation that every in-flight shot draws from
+        self.projectile_anims = Projectile.get_shared_animations(
+            {"projectile": self.sprites["projectile"]})
 
-        self.projectiles = [] # Keep track of projectiles in world
+        # Live projectiles in Structure-of-Arrays layout: parallel numpy
+        # arrays of positions and velocity vectors, all sharing one
+        # animation, so the per-frame movement is a single vectorized add
+        # no matter how many are in flight
+        self.proj_x = np.empty(0)
+        self.proj_y = np.empty(0)
+        self.proj_vx = np.empty(0)
+        self.proj_vy = np.empty(0)
 
         # Define collision sprites
         self.collision_sprites = [81, 112, 69, 101, 91, 71, 113, 79, 102]
 
+        # Boolean grid of which tiles collide, parallel to the tile id grid
+        self.collision_mask = np.isin(self.tilemap.ids,
+                                      np.array(self.collision_sprites, dtype=np.uint8))
+
         # Create camera
         self.camera = Camera(self.screen, self.player)
 
+        # Dirty-rect bookkeeping: last frame's camera adjustment and
+        # sprite rects, for partial display updates in render
+        self.prev_adj = None
+        self.prev_rects = None
+
         #######################
         ## USER INPUT SYSTEM ##
         #######################
@@ -495,33 +641,42 @@ class StartScene(Scene):
                          pygame.K_d: (270, "right"),
                          pygame.K_s: (180, "down"),
                          pygame.K_a: (90, "left")}
-        
-        self.keystack = []
-        self.current_key = None
 
-    def update(self) -> None:
+        # Flattened (key, direction) pairs so the per-frame input scan
+        # does no dict iteration or tuple unpacking of the unused angle
+        self.move_binds = tuple((key, binding[1])
+                                for key, binding in self.keybinds.items())
 
-        if self.previous_time is None: # First run through the loop needs a previous_time value to compute delta time
-            self.previous_time = time.time()
-
-        # Delta time
-        now = time.time()
-        dt = now - self.previous_time
-        self.previous_time = now 
-
-        self.tilemap.update(dt)
+    def update(self, dt) -> None:
+        # Movement input: read SDL's key state bitmap once per frame
+        # instead of bookkeeping KEYDOWN/KEYUP events in a keystack
+        keys = pygame.key.get_pressed()
+        for key, direction in self.move_binds:
+            if keys[key]:
+                if not self.player.moving or self.player.direction != direction:
+                    self.player.set_direction(direction)
+                    self.player.start_moving(_WALK_NAMES[direction])
+                break
+        else:
+            if self.player.moving:
+                self.player.stop_moving()
 
         # Tile collisions
-        for y in self.tilemap.map:
-            for x in y:     
-                if self.player.rect.colliderect(x.rect) and x.sprite_id in self.collision_sprites:
-                    print("Collision") 
-
-        for p in self.projectiles:
-            p.update(dt)
+        # One JIT-compiled scan of the tiles under the player rect against
+        # the boolean collision grid
+        if _scan_collisions(self.collision_mask,
+                            self.player.rect.left, self.player.rect.top,
+                            self.player.rect.width, self.player.rect.height,
+                            self.tilemap.tilesize):
+            if self.debug: # Avoid stdout flushes mid-frame outside debug mode
+                print("Collision")
+
+        # Move every projectile in one vectorized operation
+        self.proj_x += self.proj_vx * dt
+        self.proj_y += self.proj_vy * dt
 
         self.player.update(dt)
-        self.projectile.update(dt)
+        self.projectile_anims.update(dt) # Tick the shared projectile animation once
         self.enemy.update(dt)
         self.camera.update(dt)
     
@@ -529,24 +684,41 @@ class StartScene(Scene):
         # Clear screen
         self.screen.fill((30, 124, 184)) # Water background color
 
-        # for e in self.entities:
-        #     e.render(self.screen)
-        for y in self.tilemap.map:
-            for x in y:
-                self.screen.blit(x.sprite, (x.x + self.camera.get_camera_adjustment()[0], 
-                                            x.y + self.camera.get_camera_adjustment()[1]))
-
-        self.tilemap.render(self.screen, self.camera.get_camera_adjustment())
-        self.player.render(self.screen, self.camera.get_camera_adjustment())
-        self.projectile.render(self.screen, self.camera.get_camera_adjustment())
-
-        for p in self.projectiles:
-            p.render(self.screen, self.camera.get_camera_adjustment())
-
-        self.enemy.render(self.screen, self.camera.get_camera_adjustment())
-
-        # Update display
-        pygame.display.update()
+        # Bind the camera adjustment once for the whole frame, with the
+        # components hoisted into locals so the draw-list construction
+        # does no per-sprite indexing
+        adj = self.camera.adj_int
+        adj_x, adj_y = adj
+
+        self.tilemap.render(self.screen, adj)
+
+        # Batch every dynamic sprite into one blits() call so pygame
+        # dispatches them in a single C-level loop instead of paying the
+        # Python/C transition per sprite
+        proj_sprite = self.projectile_anims.get_current_sprite()
+        draws = [(self.player.animations.get_current_sprite(),
+                  (int(self.player.x) + adj_x, int(self.player.y) + adj_y))]
+
+        # All projectiles share one animation frame
+        draws.extend((proj_sprite, (int(x + adj_x), int(y + adj_y)))
+                     for x, y in zip(self.proj_x.tolist(), self.proj_y.tolist()))
+
+        draws.append((self.enemy.animations.get_current_sprite(),
+                      (self.enemy.x + adj_x, self.enemy.y + adj_y)))
+
+        self.screen.blits(draws, doreturn=0)
+
+        # Update display. While the camera is static only the regions the
+        # sprites occupied last frame or occupy now can differ, so just
+        # those rects are flipped; a camera pan shifts the whole map and
+        # falls back to a full update.
+        rects = [pygame.Rect(pos, surf.get_size()) for surf, pos in draws]
+        if adj == self.prev_adj and self.prev_rects is not None:
+            pygame.display.update(self.prev_rects + rects)
+        else:
+            pygame.display.update()
+        self.prev_adj = adj
+        self.prev_rects = rects
     
     def poll_events(self) -> None:
         for event in pygame.event.get():
@@ -557,40 +729,17 @@ class StartScene(Scene):
             # Attack controls
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
                 self.player.attack()
-                p = Projectile({"projectile": self.sprites["projectile"]}, self.player.x, self.player.y)
-                p.set_direction(self.player.direction)
-                self.projectiles.append(p)
-
-            if event.type == pygame.KEYDOWN and event.key in self.keybinds:
-
-                # The moment a key is pressed, add it to the keystack
-                self.keystack.append(event.key)
-                # print(self.keystack)
+                # Append the new projectile to the SoA arrays with a
+                # velocity vector derived from the player's direction
+                dx, dy = _DIR_VEC[self.player.direction]
+                vel = Projectile.velocity
+                self.proj_x = np.append(self.proj_x, self.player.x)
+                self.proj_y = np.append(self.proj_y, self.player.y)
+                self.proj_vx = np.append(self.proj_vx, dx * vel)
+                self.proj_vy = np.append(self.proj_vy, dy * vel)
 
-            if event.type == pygame.KEYUP and event.key in self.keybinds:
-
-                # If the key is released, remove it from the keystack
-                self.keystack.remove(event.key)
-                # print(self.keystack)
-
-                # if self.keybinds[event.key][1] == self.player.direction:
-                #     self.player.moving = False
-
-            # Read latest element in keystack
-            if len(self.keystack) > 0: # If keystack has any keys
-                if self.current_key != self.keystack[-1]: # If the active key has changed
-                    # Deactivate animation
-                    # self.player.animations.deactivate_animation()
-
-                    self.current_key = self.keystack[-1]
-
-                    # Player commands
-                    self.player.set_direction(self.keybinds[self.current_key][1])
-                    self.player.start_moving("walking_" + self.keybinds[event.key][1])
-
-            if len(self.keystack) == 0:
-                self.current_key = None
-                self.player.stop_moving()
+            # Movement keys are read from pygame.key.get_pressed() in
+            # update(), so no per-event bookkeeping is needed here
 
 
 
@@ -598,12 +747,12 @@ class Level1(Scene):
     def __init__(self, manager: SceneManager, screen: pygame.Surface, sprites: dict, debug: bool) -> None:
         super().__init__(manager, screen, sprites, debug)
 
-    def update(self) -> None:
-        return super().update()
-    
+    def update(self, dt) -> None:
+        return super().update(dt)
+
     def render(self) -> None:
         return super().render()
-    
+
     def poll_events(self) -> None:
         return super().poll_events()
 
@@ -611,9 +760,9 @@ class Level2(Scene):
     def __init__(self, manager: SceneManager, screen: pygame.Surface, sprites: dict, debug: bool) -> None:
         super().__init__(manager, screen, sprites, debug)
 
-    def update(self) -> None:
-        return super().update()
-    
+    def update(self, dt) -> None:
+        return super().update(dt)
+
     def render(self) -> None:
         return super().render()
 
@@ -624,8 +773,6 @@ class GameOverScene(Scene):
     def __init__(self, manager: SceneManager, screen: pygame.Surface, sprites: dict, debug: bool) -> None:
         super().__init__(manager, screen, sprites, debug)
 
-        self.previous_time = None
-
         # Create buttons
         self.quit_button = Button(500, 400, "Quit Game")
         self.restart_button = Button(480, 300, "Restart Game")
@@ -642,15 +789,14 @@ class GameOverScene(Scene):
 
         self.buttons = [self.quit_button, self.restart_button]
 
-    def update(self) -> None:
-        if self.previous_time is None: # First run through the loop needs a previous_time value to compute delta time
-            self.previous_time = time.time()
-
-        # Delta time
-        now = time.time()
-        dt = now - self.previous_time
-        self.previous_time = now 
+        # Batch the buttons through a LayeredDirty group so only buttons
+        # whose hover state changed get repainted each frame
+        background = pygame.Surface(self.screen.get_size())
+        background.fill((59, 3, 3))
+        self.button_group = pygame.sprite.LayeredDirty(self.buttons)
+        self.button_group.clear(self.screen, background)
 
+    def update(self, dt) -> None:
         mouse_x, mouse_y = pygame.mouse.get_pos() # Get mouse coords
 
         for b in self.buttons: # Check mouse over buttons
@@ -663,12 +809,16 @@ class GameOverScene(Scene):
         self.restart_button.update(dt)
     
     def render(self) -> None:
-        self.screen.fill((59, 3, 3))
+        # The group repaints only the dirty buttons and reports the
+        # changed regions
+        rects = self.button_group.draw(self.screen)
+        pygame.display.update(rects)
 
-        self.quit_button.render(self.screen)
-        self.restart_button.render(self.screen)
-
-        pygame.display.update()
+    def on_enter(self) -> None:
+        # LayeredDirty only repaints the full background on its very
+        # first draw; force one here so re-entering the scene clears
+        # whatever the previous scene left on screen
+        self.button_group.repaint_rect(self.screen.get_rect())
 
     def poll_events(self) -> None:
         for event in pygame.event.get():
@@ -686,8 +836,6 @@ class Menu(Scene):
     def __init__(self, manager: SceneManager, screen: pygame.Surface, sprites: dict, debug: bool) -> None:
         super().__init__(manager, screen, sprites, debug)
 
-        self.previous_time = None
-
         # Create buttons
         self.quit_button = Button(500, 400, "Quit Game")
         self.start_button = Button(500, 300, "Start Game")
@@ -703,15 +851,14 @@ class Menu(Scene):
 
         self.buttons = [self.quit_button, self.start_button]
 
-    def update(self) -> None:
-        if self.previous_time is None: # First run through the loop needs a previous_time value to compute delta time
-            self.previous_time = time.time()
-
-        # Delta time
-        now = time.time()
-        dt = now - self.previous_time
-        self.previous_time = now 
+        # Batch the buttons through a LayeredDirty group so only buttons
+        # whose hover state changed get repainted each frame
+        background = pygame.Surface(self.screen.get_size())
+        background.fill("black")
+        self.button_group = pygame.sprite.LayeredDirty(self.buttons)
+        self.button_group.clear(self.screen, background)
 
+    def update(self, dt) -> None:
         mouse_x, mouse_y = pygame.mouse.get_pos() # Get mouse coords
 
         for b in self.buttons: # Check mouse over buttons
@@ -724,12 +871,16 @@ class Menu(Scene):
         self.start_button.update(dt)
     
     def render(self) -> None:
-        self.screen.fill("black")
-
-        self.quit_button.render(self.screen)
-        self.start_button.render(self.screen)
+        # The group repaints only the dirty buttons and reports the
+        # changed regions
+        rects = self.button_group.draw(self.screen)
+        pygame.display.update(rects)
 
-        pygame.display.update()
+    def on_enter(self) -> None:
+        # LayeredDirty only repaints the full background on its very
+        # first draw; force one here so re-entering the scene clears
+        # whatever the previous scene left on screen
+        self.button_group.repaint_rect(self.screen.get_rect())
 
     def poll_events(self) -> None:
         for event in pygame.event.get():
@@ -749,12 +900,27 @@ class Menu(Scene):
 class Game:
     def __init__(self) -> None:
         # Initialize global game variables
-        pygame.init() 
-        self.screen = pygame.display.set_mode((1280, 720))
+        pygame.init()
+        # SCALED routes presentation through SDL's accelerated renderer
+        # (GPU texture upload + present, vsync'd) while keeping the
+        # Surface-based draw code unchanged
+        self.screen = pygame.display.set_mode((1280, 720), pygame.SCALED, vsync=1)
+
+        # Filter the event queue inside SDL: only the types the scenes
+        # actually handle ever reach Python, so MOUSEMOTION spam never
+        # costs event-loop work
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                                  pygame.MOUSEBUTTONDOWN])
+
         self.running = True
         self.sprites = self.load_sprites()
         self.debug = False # Default off
 
+        # Frame clock: caps the framerate and provides delta time from
+        # SDL's monotonic timer instead of per-scene time.time() pairs
+        self.clock = pygame.time.Clock()
+
         # Scene system
         self.scene_manager = SceneManager()
         # Register scenes
@@ -772,11 +938,11 @@ class Game:
 
     # MAIN GAME LOOP #
     def run(self) -> None:
-        self.previous_time = time.time()
         while self.running:
+            dt = self.clock.tick(60) / 1000.0 # Delta time in seconds
 
             self.scene_manager.current_scene.poll_events()
-            self.scene_manager.current_scene.update()
+            self.scene_manager.current_scene.update(dt)
             self.scene_manager.current_scene.render()
 
             if self.scene_manager.quit == True:
@@ -789,11 +955,11 @@ class Game:
     def load_sprites(self) -> dict: 
         sprites = {}
 
-        sprites["player_walk"] = pygame.image.load("gfx/player_animations.png").convert_alpha()
-        sprites["player_attack"] = pygame.image.load("gfx/attack.png").convert_alpha()
-        sprites["environment_tiles"] = pygame.image.load("gfx/rpg_sprites.png").convert_alpha()
-        sprites["enemy_idle"] = pygame.image.load("gfx/enemy_idle.png").convert_alpha()
-        sprites["projectile"] = pygame.image.load("gfx/projectile.png").convert_alpha()
+        sprites["player_walk"] = load_surface("gfx/player_animations.png")
+        sprites["player_attack"] = load_surface("gfx/attack.png")
+        sprites["environment_tiles"] = load_surface("gfx/rpg_sprites.png")
+        sprites["enemy_idle"] = load_surface("gfx/enemy_idle.png")
+        sprites["projectile"] = load_surface("gfx/projectile.png")
 
         return sprites
     
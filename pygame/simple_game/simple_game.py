@@ -1,41 +1,53 @@
-import pygame, time, random
-
-class Entity:
-    def __init__(self, 
-                 x: float, 
-                 y: float, 
+import pygame, random
+import concurrent.futures
+import functools
+
+# SysFont resolution scans the system font directories; cache the Font
+# objects so every Text with the same face and size shares one
+@functools.lru_cache(maxsize=16)
+def _get_font(name: str, size: int) -> pygame.font.Font:
+    return pygame.font.SysFont(name, size)
+
+# Entities are DirtySprites so the game can batch them through a
+# LayeredDirty group, which repaints only the sprites that changed
+class Entity(pygame.sprite.DirtySprite):
+    def __init__(self,
+                 x: float,
+                 y: float,
                  sprite: pygame.Surface) -> None:
-        
+        super().__init__()
         self.x = x
         self.y = y
         self.sprite = sprite
-
-    def update(self, dt) -> None:
-        pass
-
-    def render(self, screen: pygame.Surface) -> None:
-        pass
+        self.image = sprite # Surface drawn by the sprite group
 
 class Collectible(Entity):
     def __init__(self, x: float, y: float, sprite: pygame.Surface) -> None:
         super().__init__(x, y, sprite)
         self.rect = self.sprite.get_rect()
 
-    def randomize_position(self) -> None:
-        self.x = random.randint(50, 1250)
-        self.y = random.randint(50, 670)
-        self.rect.x = self.x
-        self.rect.y = self.y
-
-    def update(self, dt) -> None:
-        pass
+        # Spawn bounds and the bound randint method, resolved once;
+        # randomize_position fires on every pickup
+        self.randint = random.randint
+        self.x_bounds = (50, 1250)
+        self.y_bounds = (50, 670)
 
-    def render(self, screen: pygame.Surface) -> None:
-        screen.blit(self.sprite, (self.x, self.y))
+    def randomize_position(self) -> None:
+        self.x = self.randint(*self.x_bounds)
+        self.y = self.randint(*self.y_bounds)
+        self.rect.topleft = (self.x, self.y)
+        self.dirty = 1 # Mark for repaint by the group
 
 class Player(Entity):
-    def __init__(self, x: float, 
-                 y: float, 
+    # Unit movement vector per direction; move() is a multiply/add
+    # instead of a four-way string-compare chain
+    _DIRS = {"up": (0, -1),
+             "down": (0, 1),
+             "left": (-1, 0),
+             "right": (1, 0)}
+
+    def __init__(self, x: float,
+                 y: float,
                  sprite: pygame.Surface,
                  boundaries: tuple) -> None:
         super().__init__(x, y, sprite)
@@ -43,71 +55,120 @@ class Player(Entity):
         self.direction = "up" # Orientation not tied to angle
         self.velocity = 200 # Speed of player
         self.moving = False # Is player moving
-        self.boundaries = boundaries
         self.rect = self.sprite.get_rect()
+        self.rect.topleft = (int(x), int(y))
+        self.dx, self.dy = Player._DIRS[self.direction]
+
+        # Clamp bounds computed once (sprite is 48x48), not per frame
+        self.max_x = boundaries[0] - 48
+        self.max_y = boundaries[1] - 48
+
+        # The four orientations pre-rotated from the base sprite once;
+        # set_angle becomes a lookup instead of rotating the
+        # already-rotated surface on every key press
+        self.rotations = {angle: pygame.transform.rotate(sprite, angle)
+                          for angle in (0, 90, 180, 270)}
 
     def update(self, dt) -> None:
         if self.moving:
             self.move(dt)
-        self.rect.x = int(self.x)
-        self.rect.y = int(self.y)
-
-    def render(self, screen: pygame.Surface) -> None:
-        screen.blit(self.sprite, (self.x, self.y))
+            # One C-level Rect assign instead of two attribute writes
+            self.rect.topleft = (int(self.x), int(self.y))
+            self.dirty = 1
 
     def set_angle(self, new_angle: int) -> None:
-        rotation = new_angle - self.angle
-        self.sprite = pygame.transform.rotate(self.sprite, rotation)
+        self.sprite = self.rotations[new_angle]
+        self.image = self.sprite
         self.angle = new_angle
+        self.dirty = 1
 
     def set_direction(self, new_dir: str) -> None:
         self.direction = new_dir
- 
+        self.dx, self.dy = Player._DIRS[new_dir]
+
     def move(self, dt) -> None:
-        if self.direction == "up":
-            self.y -= self.velocity * dt
-        elif self.direction == "down":
-            self.y += self.velocity * dt       
-        elif self.direction == "left":
-            self.x -= self.velocity * dt      
-        elif self.direction == "right":
-            self.x += self.velocity * dt
-        
-        # Prevent player from exiting the screen
-        self.x = min((self.boundaries[0] - 48), self.x)
-        self.x = max((0, self.x))
+        step = self.velocity * dt
+        self.x += self.dx * step
+        self.y += self.dy * step
+
 
-        self.y = min((self.boundaries[1] - 48, self.y))
-        self.y = max((0, self.y))
+        # Prevent player from exiting the screen
+        if self.x > self.max_x:
+            self.x = self.max_x
+        elif self.x < 0:
+            self.x = 0
+
+        if self.y > self.max_y:
+            self.y = self.max_y
+        elif self.y < 0:
+            self.y = 0
            
 
-class Text:
+class Text(pygame.sprite.DirtySprite):
     def __init__(self, x, y, text) -> None:
+        super().__init__()
         self.x = x
         self.y = y
         self.text = text
-        self.font = pygame.font.SysFont("Calibri", 36)
+        self.font = _get_font("Calibri", 36)
+
+        # Rendered surface is cached and only rebuilt when the text
+        # actually changes, instead of rasterizing the font every frame.
+        # Premultiplied to match the group's blend mode.
+        self.rendered = self.font.render(text, True, "white").convert_alpha().premul_alpha()
+        self.image = self.rendered
+        self.rect = self.rendered.get_rect(topleft=(x, y))
+
+        # Digit glyphs pre-rendered once: numeric strings (the score) are
+        # composited from these, skipping FreeType shaping per pickup
+        self.digits = {c: self.font.render(c, True, "white").convert_alpha().premul_alpha()
+                       for c in "0123456789"}
+
+    # Build a surface for a numeric string from the cached digit glyphs
+    def compose_number(self, number_text: str) -> pygame.Surface:
+        glyphs = [self.digits[c] for c in number_text]
+        width = sum(g.get_width() for g in glyphs)
+        height = max(g.get_height() for g in glyphs)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        x = 0
+        for glyph in glyphs:
+            surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+            x += glyph.get_width()
+        return surface
 
     def set_text(self, new_text: str) -> None:
-        self.text = new_text
-
-    def update(self) -> None:
-        pass
-
-    def render(self, screen: pygame.Surface) -> None:
-        self.rendered = self.font.render(self.text, True, "white")
-        screen.blit(self.rendered, (self.x, self.y)) 
+        if new_text != self.text:
+            self.text = new_text
+            if new_text.isdigit():
+                self.rendered = self.compose_number(new_text)
+            else:
+                self.rendered = self.font.render(new_text, True, "white").convert_alpha().premul_alpha()
+            self.image = self.rendered
+            self.rect.size = self.rendered.get_size()
+            self.dirty = 1
 
 # Main game class
 class Game:
     def __init__(self) -> None:
         # Initialize global game variables
-        pygame.init() 
+        pygame.init()
         self.screen = pygame.display.set_mode((1280, 720))
+
+        # Only the event types the game handles ever enter the queue, so
+        # MOUSEMOTION spam never becomes Python Event objects
+        # Hoisted once for the per-frame event fetch in poll_events
+        self.event_types = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.event_types))
+
         self.running = True
         self.sprites = self.load_sprites()
         self.score = 0
 
+        # Frame clock: caps the framerate and provides delta time from
+        # SDL's monotonic timer instead of wall-clock time.time() pairs
+        self.clock = pygame.time.Clock()
+
         # Keybinds
         self.keybinds = {pygame.K_w: (0, "up"),
                          pygame.K_d: (270, "right"),
@@ -123,6 +184,12 @@ class Game:
         self.collectible.randomize_position()
         self.text = Text(600, 50, "Mouse position: ")
 
+        # Batch the entities through a LayeredDirty group: it restores
+        # the background under sprites that moved and repaints only
+        # those, reporting the changed regions for the display update
+        self.group = pygame.sprite.LayeredDirty(self.player, self.collectible, self.text)
+        self.group.clear(self.screen, self.sprites["background"])
+
         # Load sounds
         pygame.mixer.music.load("sfx/music.ogg")
         pygame.mixer.music.set_volume(0.25)
@@ -133,7 +200,6 @@ class Game:
 
     # MAIN GAME LOOP #
     def run(self) -> None:
-        self.previous_time = time.time()
         while self.running:
 
             self.poll_events()
@@ -143,71 +209,85 @@ class Game:
         pygame.quit()
 
     def poll_events(self) -> None:
-        for event in pygame.event.get():
+        for event in pygame.event.get(self.event_types):
+            event_type = event.type
 
-            if event.type == pygame.QUIT: # If the user closes the window
+            if event_type == pygame.QUIT: # If the user closes the window
                 self.running = False
+                continue
+
+            if event_type != pygame.KEYDOWN and event_type != pygame.KEYUP:
+                continue
+
+            # One dict lookup per key event instead of membership test
+            # plus repeated indexing
+            bind = self.keybinds.get(event.key)
+            if bind is None:
+                continue
 
-            if event.type == pygame.KEYDOWN and event.key in self.keybinds:
-                self.player.set_angle(self.keybinds[event.key][0])
-                self.player.set_direction(self.keybinds[event.key][1])
+            if event_type == pygame.KEYDOWN:
+                self.player.set_angle(bind[0])
+                self.player.set_direction(bind[1])
                 self.player.moving = True
-            
-            if event.type == pygame.KEYUP and event.key in self.keybinds:
-                if self.keybinds[event.key][1] == self.player.direction:
-                    self.player.moving = False
-                
+            elif bind[1] == self.player.direction: # KEYUP
+                self.player.moving = False
+
 
     def update(self) -> None:
-        # Compute delta time
-        now = time.time()
-        dt = now - self.previous_time
-        self.previous_time = now 
+        # Delta time in seconds, with the frame rate capped at 60
+        dt = self.clock.tick(60) / 1000.0
 
         # Update player
-        self.player.update(dt)
-
-        # Check collision between player and collectible
-        if self.player.rect.colliderect(self.collectible.rect):
+        player = self.player
+        player.update(dt)
+
+        # Check collision between player and collectible. With a single
+        # pair, Rect.colliderect in C beats a Python-side overlap test;
+        # a vectorized numpy AABB pass only pays off once there are many
+        # collectibles.
+        if player.rect.colliderect(self.collectible.rect):
             self.collectible.randomize_position()
             self.collect_sound.play() # Play sound
             # Increase player speed
-            self.player.velocity += 100
+            player.velocity += 100
             self.score += 1
 
-        self.text.update()
         self.text.set_text(str(self.score))
 
     def render(self) -> None:
-        # Clear screen
-        self.screen.fill("black")
-
-        # Render background
-        self.screen.blit(self.sprites["background"], (0, 0))
-
-        # Render player
-        self.player.render(self.screen)
+        # The group repaints only the dirty sprites over the cached
+        # background and reports the changed regions
+        dirty = self.group.draw(self.screen, special_flags=pygame.BLEND_PREMULTIPLIED)
+        pygame.display.update(dirty)
 
-        # Render collectible
-        self.collectible.render(self.screen)
-
-        # Render text
-        self.text.render(self.screen)
-
-        # Update the display
-        pygame.display.update() 
-
-    # Load sprite textures into pygame as surfaces. 
+    # Load sprite textures into pygame as surfaces.
     # Returns a dictionary of names to surfaces.
-    def load_sprites(self) -> dict: 
+    def load_sprites(self) -> dict:
         sprites = {}
 
-        sprites["collectible"] = pygame.image.load("gfx/collectible.png").convert_alpha()
-        sprites["background"] = pygame.image.load("gfx/simple_game_bg.png").convert_alpha()
-        sprites["spaceship"] = pygame.image.load("gfx/ship.png").convert_alpha()
-
-        # Downscale
-        sprites["spaceship"] = pygame.transform.scale(sprites["spaceship"], (48, 48))
+        # pygame.image.load releases the GIL for the file read and PNG
+        # decode, so the three images decode in parallel; the display
+        # conversions below still run on the main thread
+        paths = {"collectible": "gfx/collectible.png",
+                 "background": "gfx/simple_game_bg.png",
+                 "spaceship": "gfx/ship.png"}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(paths)) as pool:
+            futures = {name: pool.submit(pygame.image.load, path)
+                       for name, path in paths.items()}
+
+        # Ship and collectible both have anti-aliased edges, so colorkey
+        # transparency is out; premultiplied alpha keeps the smooth edges
+        # while using SDL's cheaper premultiplied blend in the blitter
+        sprites["collectible"] = futures["collectible"].result().convert_alpha().premul_alpha()
+        # The background is opaque and covers the window, so convert() to
+        # the display format: its blit is a straight copy with no alpha
+        sprites["background"] = futures["background"].result().convert()
+        sprites["spaceship"] = futures["spaceship"].result().convert_alpha()
+
+        # Downscale once at load time; smoothscale's box filter costs
+        # nothing per frame here and avoids the aliasing of nearest-
+        # neighbour scale on a large reduction
+        sprites["spaceship"] = pygame.transform.smoothscale(sprites["spaceship"], (48, 48)).premul_alpha()
 
         return sprites
     